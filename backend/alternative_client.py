@@ -3,6 +3,7 @@ Alternative NetSuite client using RESTlet approach
 """
 import requests
 from requests_oauthlib import OAuth1
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 from typing import Dict, Any, Optional
@@ -25,7 +26,23 @@ class NetSuiteRESTletClient:
             resource_owner_key=self.token_id,
             resource_owner_secret=self.token_secret,
             realm=self.account_id,
-            signature_method="HMAC-SHA1"
+            # NetSuite TBA supports HMAC-SHA256, which modern CPUs hash faster
+            # than software SHA-1 thanks to dedicated SHA instructions
+            signature_method="HMAC-SHA256"
+        )
+
+        # One Session for the client's lifetime so keep-alive reuses the
+        # TCP/TLS connection instead of handshaking on every call
+        self.session = requests.Session()
+        self.session.auth = self.auth
+
+        # Account id is immutable per instance, so derive the host and the
+        # auth-probe endpoints once instead of per test_basic_auth call
+        self._account_host = self.account_id.replace('_', '-').lower()
+        self._probe_endpoints = (
+            f"https://{self._account_host}.restlets.api.netsuite.com/app/site/hosting/restlet.nl",
+            f"https://{self._account_host}.suitetalk.api.netsuite.com/services/rest/record/v1/metadata-catalog",
+            f"{self.base_url}/app/site/hosting/restlet.nl",
         )
     
     def execute_suiteql_via_restlet(self, query: str) -> Dict[str, Any]:
@@ -49,11 +66,10 @@ class NetSuiteRESTletClient:
         try:
             logger.info(f"Trying RESTlet approach with URL: {url}")
             
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=payload,
                 headers=headers,
-                auth=self.auth,
                 timeout=30
             )
             
@@ -76,36 +92,33 @@ class NetSuiteRESTletClient:
     def test_basic_auth(self) -> Dict[str, Any]:
         """Test basic authentication with different endpoints"""
         
-        endpoints_to_test = [
-            # Different possible endpoint formats
-            f"https://{self.account_id.replace('_', '-').lower()}.restlets.api.netsuite.com/app/site/hosting/restlet.nl",
-            f"https://{self.account_id.replace('_', '-').lower()}.suitetalk.api.netsuite.com/services/rest/record/v1/metadata-catalog",
-            f"{self.base_url}/app/site/hosting/restlet.nl",
-        ]
-        
-        results = []
-        
-        for endpoint in endpoints_to_test:
+        endpoints_to_test = self._probe_endpoints
+
+        def probe(endpoint):
             try:
                 logger.info(f"Testing endpoint: {endpoint}")
-                
-                response = requests.get(
+
+                response = self.session.get(
                     endpoint,
                     headers={"Accept": "application/json"},
-                    auth=self.auth,
                     timeout=10
                 )
-                
-                results.append({
+
+                return {
                     "endpoint": endpoint,
                     "status_code": response.status_code,
                     "response": response.text[:200] if response.text else "No response"
-                })
-                
+                }
+
             except Exception as e:
-                results.append({
+                return {
                     "endpoint": endpoint,
                     "error": str(e)
-                })
-        
+                }
+
+        # The probes are independent, so run them concurrently and pay only
+        # the slowest round-trip instead of the sum of all three
+        with ThreadPoolExecutor(max_workers=len(endpoints_to_test)) as executor:
+            results = list(executor.map(probe, endpoints_to_test))
+
         return {"test_results": results}
\ No newline at end of file